@@ -11,6 +11,7 @@ DEFAULT_START_YEAR = _CURRENT_YEAR - 3
 DEFAULT_END_YEAR = _CURRENT_YEAR
 DEFAULT_LIMIT = 100
 DEFAULT_DESCRIPTION_WORD_LIMIT = 800
+DESCRIPTION_CHARS_PER_WORD = 8
 DEFAULT_GCP_PROJECT_ID = "axial-analyzer-475800-v4"
 
 CPC_PREFIXES = [
@@ -31,6 +32,22 @@ KEYWORD_PHRASES = [
     "can coating",
 ]
 
+# Records mentioning none of these terms are not sent to the LLM.
+PREFILTER_TERMS = [
+    "epoxy",
+    "polyester",
+    "bpa",
+    "bpf",
+    "bisphenol",
+    "acrylic",
+    "phenolic",
+    "oleoresin",
+    "pvc",
+    "polyvinyl chloride",
+    "polyolefin",
+    "hybrid",
+]
+
 COATING_CHOICES = [
     "Epoxy (BPA)",
     "Epoxy (BPF)",
@@ -44,9 +61,13 @@ COATING_CHOICES = [
 ]
 
 DEFAULT_OPENROUTER_MODEL = "x-ai/grok-4-fast"
-DEFAULT_OPENROUTER_TIMEOUT = 30.0
-DEFAULT_OPENROUTER_DELAY = 1.0
+DEFAULT_OPENROUTER_TIMEOUT = 300.0
+DEFAULT_OPENROUTER_FIRST_TOKEN_TIMEOUT = 10.0
+DEFAULT_OPENROUTER_DELAY = 0.0
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_CACHE_PATH = "data/.llm_cache.sqlite"
 
 ENV_OPENROUTER_API_KEY = "OPENROUTER_API_KEY"
 ENV_OPENROUTER_APP_URL = "OPENROUTER_APP_URL"
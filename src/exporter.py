@@ -3,41 +3,119 @@
 from __future__ import annotations
 
 import csv
-from typing import Iterable
+import queue
+import threading
+from types import TracebackType
+from typing import Iterable, Optional, Tuple, Type
 
+import pandas as pd
 
-def write_csv(records: Iterable[dict], path: str, include_era: bool) -> None:
-    fieldnames = [
-        "publication_number",
-        "publication_date",
-        "title",
-        "abstract",
-        "assignee",
-        "cpc_codes",
-        "description",
-        "first_claim",
-        "coating_type",
-        "classification_confidence",
-    ]
+from . import utils
+
+FIELDNAMES = [
+    "publication_number",
+    "publication_date",
+    "title",
+    "abstract",
+    "assignee",
+    "cpc_codes",
+    "description",
+    "first_claim",
+    "coating_type",
+    "classification_confidence",
+]
+
+_DONE = object()
+
+
+def _to_row(record: dict, include_era: bool) -> Tuple:
+    row = (
+        record.get("publication_number"),
+        record.get("publication_date"),
+        record.get("title"),
+        record.get("abstract"),
+        record.get("assignee"),
+        "; ".join(record.get("cpc_codes") or []),
+        record.get("description"),
+        record.get("first_claim"),
+        record.get("coating_type"),
+        record.get("classification_confidence"),
+    )
     if include_era:
-        fieldnames.append("era")
+        return row + (record.get("era"),)
+    return row
+
+
+class AsyncCsvWriter:
+    """CSV writer whose serialisation and disk I/O run on a background thread.
+
+    ``put`` snapshots the record as a row tuple and enqueues it, so producers (BigQuery
+    paging, the classification event loop) never wait on the file and later changes
+    to the record do not leak into the row. ``join`` flushes everything, closes the
+    file, and re-raises any error hit by the writer thread. Usable as a context manager.
+    """
+
+    def __init__(self, path: str, include_era: bool) -> None:
+        self._fieldnames = FIELDNAMES + ["era"] if include_era else FIELDNAMES
+        self._include_era = include_era
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._queue: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._drain, name=f"csv-writer:{path}", daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        try:
+            writer = csv.writer(self._file)
+            writer.writerow(self._fieldnames)
+            # Tuples in column order let the C writer iterate without DictWriter's per-row remapping.
+            writer.writerows(iter(self._queue.get, _DONE))
+        except BaseException as exc:  # noqa: BLE001 - surfaced to the caller in join()
+            self._error = exc
+            for _ in iter(self._queue.get, _DONE):
+                pass
 
-    with open(path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    def put(self, record: dict) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(_to_row(record, self._include_era))
+
+    def join(self) -> None:
+        self._queue.put(_DONE)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "AsyncCsvWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.join()
+
+
+def write_csv(records: Iterable[dict], path: str, include_era: bool) -> None:
+    with AsyncCsvWriter(path, include_era=include_era) as writer:
         for record in records:
-            row = {
-                "publication_number": record.get("publication_number"),
-                "publication_date": record.get("publication_date"),
-                "title": record.get("title"),
-                "abstract": record.get("abstract"),
-                "assignee": record.get("assignee"),
-                "cpc_codes": "; ".join(record.get("cpc_codes") or []),
-                "description": record.get("description"),
-                "first_claim": record.get("first_claim"),
-                "coating_type": record.get("coating_type"),
-                "classification_confidence": record.get("classification_confidence"),
-            }
-            if include_era:
-                row["era"] = record.get("era")
-            writer.writerow(row)
+            writer.put(record)
+
+
+def write_frame_csv(records: Iterable[dict], path: str, include_era: bool) -> None:
+    """Write a fully materialised export through pandas in one vectorised pass.
+
+    Missing ``coating_type``/``classification_confidence`` columns are written empty,
+    and ``era`` is derived column-wise rather than record by record.
+    """
+    fieldnames = FIELDNAMES + ["era"] if include_era else FIELDNAMES
+    frame = pd.DataFrame.from_records(records, columns=FIELDNAMES + ["publication_year"])
+    frame["cpc_codes"] = frame["cpc_codes"].map(
+        lambda codes: "; ".join(codes) if isinstance(codes, list) else ""
+    )
+    if include_era:
+        frame["era"] = utils.determine_era_series(frame["publication_year"], frame["coating_type"])
+    frame.to_csv(path, columns=fieldnames, index=False, encoding="utf-8", lineterminator="\r\n")
@@ -0,0 +1,79 @@
+"""On-disk cache of LLM classification results."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from types import TracebackType
+from typing import Iterable, Optional, Tuple, Type
+
+import orjson
+
+
+def cache_key(messages: list, model: str, variant: object = None) -> str:
+    """Content hash identifying one prompt sent to one model.
+
+    ``variant`` is any JSON-serialisable value for request settings outside
+    ``messages`` that also shape the answer, such as a response schema.
+    """
+    return hashlib.blake2b(orjson.dumps([messages, model, variant]), digest_size=32).hexdigest()
+
+
+class ClassificationCache:
+    """SQLite table mapping prompt hashes to ``(coating_type, confidence)``.
+
+    Re-running the pipeline over the same patents with the same prompt and model then
+    skips the OpenRouter call entirely. Safe to share between threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL keeps the per-result commits cheap.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS classifications ("
+            "key TEXT PRIMARY KEY, coating_type TEXT, confidence REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], Optional[float]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT coating_type, confidence FROM classifications WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, coating_type: Optional[str], confidence: Optional[float]) -> None:
+        self.set_many([(key, coating_type, confidence)])
+
+    def set_many(self, entries: Iterable[Tuple[str, Optional[str], Optional[float]]]) -> None:
+        """Store several ``(key, coating_type, confidence)`` rows in one transaction."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO classifications (key, coating_type, confidence) VALUES (?, ?, ?)",
+                entries,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ClassificationCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -2,15 +2,142 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
-import time
-from typing import Iterable, Optional, Tuple
+import re
+from collections import Counter
+from contextlib import AsyncExitStack
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from . import config, utils
+from .llm_cache import ClassificationCache, cache_key
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Shared session so urllib3 keeps the TLS connection to OpenRouter alive
+# between calls instead of re-handshaking for every record.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+
+
+class _RetryableHTTPError(Exception):
+    """OpenRouter response that is worth retrying (rate limit or server error)."""
+
+    def __init__(self, message: str, retry_after: float = 0.0) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _TerminalHTTPError(Exception):
+    """OpenRouter response that will not succeed on retry (bad request, auth, etc.)."""
+
+    def __init__(self, message: str, status_code: int = 0) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+_RETRYABLE_HTTP_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    httpx.TransportError,
+    _RetryableHTTPError,
+)
+# Malformed single-record output (ValueError) is retried as before; terminal HTTP errors are not.
+_RETRYABLE_ERRORS = _RETRYABLE_HTTP_ERRORS + (ValueError,)
+# Terminal statuses caused by the batch payload itself (malformed or too large), which
+# smaller single-record requests may avoid; auth or unknown-model errors would not.
+_BATCH_PAYLOAD_STATUSES = (400, 413)
+_BACKOFF = wait_random_exponential(multiplier=0.5, max=30)
+
+# Cheap local screen: patents that never mention a coating chemistry are not sent
+# to the LLM at all.
+_PREFILTER_RE = re.compile("|".join(map(re.escape, config.PREFILTER_TERMS)), re.IGNORECASE)
+
+
+# Prompt text shared by every request, built once so identical prefixes can also
+# benefit from provider-side prompt caching.
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a materials scientist specialised in can coating chemistries.",
+}
+_ALLOWED_STR = ", ".join(config.COATING_CHOICES)
+_USER_PREFIX = (
+    "Classify the coating chemistry for the following patent. "
+    "Respond with a compact JSON object containing only the key "
+    "'coating_type' using one of the allowed categories, and the key "
+    "'confidence' with a number between 0 and 1.\n\n"
+    f"Allowed categories: {_ALLOWED_STR}\n\n"
+)
+_BATCH_USER_PREFIX = (
+    "Classify the coating chemistry for each of the following patents. "
+    "Respond with a compact JSON object whose key 'results' is an array with exactly "
+    "one entry per input record, in the same order. Each entry is an object with the "
+    "key 'publication_number' copied from the record, the key 'coating_type' using one "
+    "of the allowed categories, and the key 'confidence' with a number between 0 and 1.\n\n"
+    f"Allowed categories: {_ALLOWED_STR}\n\n"
+)
+
+# Strict structured-output schemas steer the model to the allowed categories. Strict
+# mode needs every property listed as required and no additional properties.
+# Providers may still deviate, so results are checked again in _coerce_classification.
+_CLASSIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "coating_type": {"enum": config.COATING_CHOICES},
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+    },
+    "required": ["coating_type", "confidence"],
+    "additionalProperties": False,
+}
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "coating", "strict": True, "schema": _CLASSIFICATION_SCHEMA},
+}
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "coating_batch",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "publication_number": {"type": "string"},
+                            **_CLASSIFICATION_SCHEMA["properties"],
+                        },
+                        "required": ["publication_number", "coating_type", "confidence"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+# Only route to providers that honour response_format instead of silently dropping it.
+_PROVIDER_PREFERENCES = {"require_parameters": True}
 
 
 def _truncate(text: Optional[str], max_chars: int) -> str:
@@ -19,16 +146,11 @@ def _truncate(text: Optional[str], max_chars: int) -> str:
     return text[:max_chars]
 
 
-def build_classification_prompt(record: dict) -> list:
+def _format_record(record: dict) -> str:
     description_excerpt = _truncate(record.get("description"), 1200)
     first_claim_excerpt = _truncate(record.get("first_claim"), 800)
 
-    content = (
-        "Classify the coating chemistry for the following patent. "
-        "Respond with a compact JSON object containing only the key "
-        "'coating_type' using one of the allowed categories, and an optional "
-        "'confidence' number between 0 and 1.\n\n"
-        f"Allowed categories: {', '.join(config.COATING_CHOICES)}\n\n"
+    return (
         f"Publication number: {record.get('publication_number')}\n"
         f"Publication date: {record.get('publication_date')}\n"
         f"Title: {record.get('title')}\n"
@@ -39,21 +161,29 @@ def build_classification_prompt(record: dict) -> list:
         f"First claim excerpt: {first_claim_excerpt}\n"
     )
 
-    return [
-        {
-            "role": "system",
-            "content": "You are a materials scientist specialised in can coating chemistries.",
-        },
-        {"role": "user", "content": content},
-    ]
 
+def build_classification_prompt(record: dict) -> list:
+    return [_SYSTEM_MSG, {"role": "user", "content": _USER_PREFIX + _format_record(record)}]
 
-def call_openrouter(
-    api_key: str,
-    model: str,
-    payload: dict,
-    timeout: float,
-) -> dict:
+
+def build_batch_prompt(records_chunk: Sequence[dict]) -> list:
+    count = len(records_chunk)
+    entries = "\n".join(
+        f"Record {index}:\n{_format_record(record)}"
+        for index, record in enumerate(records_chunk, start=1)
+    )
+    content = f"{_BATCH_USER_PREFIX}Number of records: {count}\n\n{entries}"
+    return [_SYSTEM_MSG, {"role": "user", "content": content}]
+
+
+def _record_cache_key(record: dict, model: str, batch_size: int) -> str:
+    # Batched answers are filed under the single-record prompt, so the batch prompt,
+    # both response schemas and the batch size are part of the key as well.
+    variant = [_BATCH_USER_PREFIX, _RESPONSE_FORMAT, _BATCH_RESPONSE_FORMAT, batch_size]
+    return cache_key(build_classification_prompt(record), model, variant)
+
+
+def _build_headers(api_key: str) -> dict:
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
@@ -63,18 +193,214 @@ def call_openrouter(
         headers["HTTP-Referer"] = referer
     title = os.getenv(config.ENV_OPENROUTER_TITLE, "Patent Coating Classification")
     headers["X-Title"] = title
+    return headers
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float:
+    try:
+        return max(float(headers.get("Retry-After", 0)), 0.0)
+    except (TypeError, ValueError):
+        # HTTP-date values are rare for OpenRouter; fall back to exponential backoff.
+        return 0.0
+
+
+def _raise_for_status(status_code: int, headers: Mapping[str, str], text: str) -> None:
+    if status_code < 400:
+        return
+    message = f"OpenRouter returned HTTP {status_code}: {text[:200]}"
+    if status_code in (408, 429) or status_code >= 500:
+        raise _RetryableHTTPError(message, retry_after=_parse_retry_after(headers))
+    raise _TerminalHTTPError(message, status_code=status_code)
+
+
+def _wait_with_retry_after(retry_state: RetryCallState) -> float:
+    backoff = _BACKOFF(retry_state)
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    return max(backoff, getattr(exc, "retry_after", 0.0))
+
 
-    response = requests.post(
-        "https://openrouter.ai/api/v1/chat/completions",
-        headers=headers,
+def _log_retry(retry_state: RetryCallState) -> None:
+    logging.warning(
+        "OpenRouter error (attempt %s): %s; retrying in %.1fs",
+        retry_state.attempt_number,
+        retry_state.outcome.exception() if retry_state.outcome else None,
+        retry_state.next_action.sleep if retry_state.next_action else 0.0,
+    )
+
+
+def _retry_policy(max_retries: int, retryable: Tuple[type, ...] = _RETRYABLE_ERRORS) -> dict:
+    return {
+        "retry": retry_if_exception_type(retryable),
+        "wait": _wait_with_retry_after,
+        "stop": stop_after_attempt(max_retries),
+        "before_sleep": _log_retry,
+        "reraise": True,
+    }
+
+
+def call_openrouter(
+    api_key: str,
+    model: str,
+    payload: dict,
+    timeout: float,
+) -> dict:
+    response = _SESSION.post(
+        OPENROUTER_URL,
+        headers=_build_headers(api_key),
         timeout=timeout,
-        json={
-            "model": model,
-            **payload,
-        },
+        data=orjson.dumps(
+            {
+                "model": model,
+                **payload,
+            }
+        ),
     )
-    response.raise_for_status()
-    return response.json()
+    _raise_for_status(response.status_code, response.headers, response.text)
+    return orjson.loads(response.content)
+
+
+async def call_openrouter_async(
+    client: httpx.AsyncClient,
+    api_key: str,
+    model: str,
+    payload: dict,
+    first_token_timeout: float,
+) -> dict:
+    """Stream a chat completion and return it in the non-streaming response shape.
+
+    The request is abandoned with ``httpx.ReadTimeout`` (retryable) if no streamed delta
+    (content or reasoning) arrives within ``first_token_timeout`` seconds; once deltas
+    flow, the whole request may take up to the client's read timeout.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + first_token_timeout
+    parts: List[str] = []
+    streaming = False
+
+    async with AsyncExitStack() as stack:
+        # The first-token budget also covers waiting for the response headers, which
+        # the client's read timeout alone would let run for the full request timeout.
+        stream = client.stream(
+            "POST",
+            OPENROUTER_URL,
+            headers=_build_headers(api_key),
+            content=orjson.dumps(
+                {
+                    "model": model,
+                    **payload,
+                    "stream": True,
+                }
+            ),
+        )
+        try:
+            response = await asyncio.wait_for(stack.enter_async_context(stream), timeout=first_token_timeout)
+        except asyncio.TimeoutError as err:
+            raise httpx.ReadTimeout(
+                f"OpenRouter did not send response headers within {first_token_timeout:g}s"
+            ) from err
+
+        if response.status_code >= 400:
+            await response.aread()
+            _raise_for_status(response.status_code, response.headers, response.text)
+
+        lines = response.aiter_lines()
+        while True:
+            try:
+                line = await asyncio.wait_for(lines.__anext__(), timeout=max(deadline - loop.time(), 0.0))
+            except StopAsyncIteration:
+                break
+            except asyncio.TimeoutError as err:
+                stage = "finish streaming" if streaming else "send a first token"
+                raise httpx.ReadTimeout(
+                    f"OpenRouter did not {stage} within {deadline - started:g}s"
+                ) from err
+
+            # SSE comments (": OPENROUTER PROCESSING") are keep-alives, not tokens.
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            chunk = orjson.loads(data)
+            if chunk.get("error"):
+                raise _RetryableHTTPError(f"OpenRouter stream error: {chunk['error']}")
+            choices = chunk.get("choices") or [{}]
+            delta = choices[0].get("delta") or {}
+            # Any non-empty delta (role, reasoning or content) shows the model is
+            # answering, so it ends the first-token wait.
+            if not streaming and any(delta.values()):
+                streaming = True
+                deadline = started + (client.timeout.read or config.DEFAULT_OPENROUTER_TIMEOUT)
+            token = delta.get("content")
+            if token:
+                parts.append(token)
+
+    return {"choices": [{"message": {"content": "".join(parts)}}]}
+
+
+def _load_content(response: dict) -> object:
+    choices = response.get("choices")
+    if not choices:
+        raise ValueError("No choices returned from OpenRouter response.")
+    message = choices[0].get("message", {})
+    content = (message.get("content") or "").strip()
+    if not content:
+        raise ValueError("Empty content in LLM response.")
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        # The stdlib parser is more lenient (e.g. NaN literals), so give it a second look.
+        return json.loads(content)
+    except json.JSONDecodeError as err:
+        raise ValueError(f"Failed to parse JSON from response: {content}") from err
+
+
+def _coerce_classification(parsed: dict) -> Tuple[Optional[str], Optional[float]]:
+    coating_type = parsed.get("coating_type")
+    confidence = parsed.get("confidence")
+    if coating_type is not None and coating_type not in config.COATING_CHOICES:
+        # Left unclassified (and therefore uncached) rather than exported as-is.
+        logging.warning("Discarding coating_type '%s' outside expected choices.", coating_type)
+        return None, None
+    return coating_type, float(confidence) if confidence is not None else None
+
+
+def _parse_classification(response: dict) -> Tuple[Optional[str], Optional[float]]:
+    parsed = _load_content(response)
+    if not isinstance(parsed, dict):
+        raise ValueError(f"Expected a JSON object, got {type(parsed).__name__}.")
+    return _coerce_classification(parsed)
+
+
+def _parse_batch_classification(response: dict) -> Dict[str, Tuple[Optional[str], Optional[float]]]:
+    """Map publication numbers to classifications from a batch response."""
+    parsed = _load_content(response)
+    entries = parsed.get("results") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError("Expected a JSON object with a 'results' array.")
+    results = {}
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get("publication_number"):
+            results[str(entry["publication_number"])] = _coerce_classification(entry)
+    return results
+
+
+def _do_call(
+    payload: dict,
+    api_key: str,
+    model: str,
+    timeout: float,
+) -> Tuple[Optional[str], Optional[float]]:
+    response = call_openrouter(
+        api_key=api_key,
+        model=model,
+        payload=payload,
+        timeout=timeout,
+    )
+    return _parse_classification(response)
 
 
 def classify_record(
@@ -83,47 +409,495 @@ def classify_record(
     model: str,
     timeout: float,
     max_retries: int,
+    cache: Optional[ClassificationCache] = None,
 ) -> Tuple[Optional[str], Optional[float]]:
     messages = build_classification_prompt(record)
     payload = {
         "messages": messages,
         "temperature": 0.0,
+        "response_format": _RESPONSE_FORMAT,
+        "provider": _PROVIDER_PREFERENCES,
     }
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = call_openrouter(
+    key = _record_cache_key(record, model, batch_size=1) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    retrying = Retrying(**_retry_policy(max_retries))
+    try:
+        coating_type, confidence = retrying(
+            _do_call, payload=payload, api_key=api_key, model=model, timeout=timeout
+        )
+        if cache is not None and coating_type is not None:
+            cache.set(key, coating_type, confidence)
+        return coating_type, confidence
+    except _TerminalHTTPError as exc:
+        logging.error("OpenRouter rejected request for %s: %s", record.get("publication_number"), exc)
+    except Exception as exc:  # noqa: BLE001
+        logging.error("OpenRouter error for %s, giving up: %s", record.get("publication_number"), exc)
+    return None, None
+
+
+def build_async_client(timeout: float, max_concurrency: int) -> httpx.AsyncClient:
+    """Create the pooled client used for a classification run.
+
+    ``timeout`` bounds a whole streamed response; connection setup fails fast.
+    """
+    limits = httpx.Limits(
+        max_keepalive_connections=max_concurrency,
+        max_connections=max_concurrency,
+    )
+    timeouts = httpx.Timeout(connect=5.0, read=timeout, write=10.0, pool=5.0)
+    return httpx.AsyncClient(timeout=timeouts, limits=limits)
+
+
+class _RequestPacer:
+    """Enforce a minimum spacing between request starts across concurrent tasks."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        if self._interval <= 0:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            pause = self._next_start - loop.time()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            self._next_start = loop.time() + self._interval
+
+
+async def _do_call_async(
+    client: httpx.AsyncClient,
+    payload: dict,
+    api_key: str,
+    model: str,
+    first_token_timeout: float,
+    semaphore: asyncio.Semaphore,
+    pacer: _RequestPacer,
+    parse: Callable[[dict], object] = _parse_classification,
+):
+    async with semaphore:
+        # Pace after acquiring a slot so requests released together still start spaced out.
+        await pacer.wait()
+        response = await call_openrouter_async(
+            client=client,
+            api_key=api_key,
+            model=model,
+            payload=payload,
+            first_token_timeout=first_token_timeout,
+        )
+    return parse(response)
+
+
+async def classify_record_async(
+    client: httpx.AsyncClient,
+    record: dict,
+    api_key: str,
+    model: str,
+    max_retries: int,
+    first_token_timeout: float,
+    semaphore: asyncio.Semaphore,
+    pacer: _RequestPacer,
+) -> Tuple[Optional[str], Optional[float]]:
+    messages = build_classification_prompt(record)
+    payload = {
+        "messages": messages,
+        "temperature": 0.0,
+        "response_format": _RESPONSE_FORMAT,
+        "provider": _PROVIDER_PREFERENCES,
+    }
+
+    retrying = AsyncRetrying(**_retry_policy(max_retries))
+    try:
+        return await retrying(
+            _do_call_async,
+            client=client,
+            payload=payload,
+            api_key=api_key,
+            model=model,
+            first_token_timeout=first_token_timeout,
+            semaphore=semaphore,
+            pacer=pacer,
+        )
+    except _TerminalHTTPError as exc:
+        logging.error("OpenRouter rejected request for %s: %s", record.get("publication_number"), exc)
+    except Exception as exc:  # noqa: BLE001
+        logging.error("OpenRouter error for %s, giving up: %s", record.get("publication_number"), exc)
+    return None, None
+
+
+async def classify_batch_async(
+    client: httpx.AsyncClient,
+    records_chunk: Sequence[dict],
+    api_key: str,
+    model: str,
+    max_retries: int,
+    first_token_timeout: float,
+    semaphore: asyncio.Semaphore,
+    pacer: _RequestPacer,
+) -> List[Tuple[Optional[str], Optional[float]]]:
+    """Classify several records in one request, returning results in input order.
+
+    Records the model leaves out, or every record of a batch whose response is not a
+    usable JSON array or whose payload was rejected as malformed or too large, are
+    re-sent as single-record calls.
+    """
+    payload = {
+        "messages": build_batch_prompt(records_chunk),
+        "temperature": 0.0,
+        "response_format": _BATCH_RESPONSE_FORMAT,
+        "provider": _PROVIDER_PREFERENCES,
+    }
+
+    retrying = AsyncRetrying(**_retry_policy(max_retries, _RETRYABLE_HTTP_ERRORS))
+    try:
+        results = await retrying(
+            _do_call_async,
+            client=client,
+            payload=payload,
+            api_key=api_key,
+            model=model,
+            first_token_timeout=first_token_timeout,
+            semaphore=semaphore,
+            pacer=pacer,
+            parse=_parse_batch_classification,
+        )
+    except _TerminalHTTPError as exc:
+        if exc.status_code not in _BATCH_PAYLOAD_STATUSES:
+            logging.error("OpenRouter rejected batch of %s records: %s", len(records_chunk), exc)
+            return [(None, None)] * len(records_chunk)
+        logging.warning(
+            "Batch of %s records rejected (%s); falling back to single-record calls.",
+            len(records_chunk),
+            exc,
+        )
+        results = {}
+    except ValueError as exc:
+        logging.warning(
+            "Batch of %s records failed (%s); falling back to single-record calls.",
+            len(records_chunk),
+            exc,
+        )
+        results = {}
+    except Exception as exc:  # noqa: BLE001
+        logging.error("OpenRouter error for batch of %s records, giving up: %s", len(records_chunk), exc)
+        return [(None, None)] * len(records_chunk)
+
+    missing = [
+        record for record in records_chunk if str(record.get("publication_number")) not in results
+    ]
+    if missing:
+        fallbacks = await asyncio.gather(
+            *[
+                classify_record_async(
+                    client=client,
+                    record=record,
+                    api_key=api_key,
+                    model=model,
+                    max_retries=max_retries,
+                    first_token_timeout=first_token_timeout,
+                    semaphore=semaphore,
+                    pacer=pacer,
+                )
+                for record in missing
+            ]
+        )
+        for record, outcome in zip(missing, fallbacks):
+            results[str(record.get("publication_number"))] = outcome
+
+    return [results[str(record.get("publication_number"))] for record in records_chunk]
+
+
+def _mentions_coating_chemistry(record: dict) -> bool:
+    fields = (
+        record.get("title"),
+        record.get("abstract"),
+        record.get("first_claim"),
+        (record.get("description") or "")[:2000],
+    )
+    return any(field and _PREFILTER_RE.search(field) for field in fields)
+
+
+def _apply_classification(
+    record: dict,
+    coating_type: Optional[str],
+    confidence: Optional[float],
+    include_era: bool,
+    on_classified: Optional[Callable[[dict], None]] = None,
+) -> None:
+    record["coating_type"] = coating_type
+    record["classification_confidence"] = confidence
+    if include_era:
+        record["era"] = utils.determine_era(record.get("publication_year"), coating_type)
+    if on_classified is not None:
+        on_classified(record)
+
+
+def _resolve_locally(
+    record: dict,
+    model: str,
+    batch_size: int,
+    include_era: bool,
+    prefilter: bool,
+    cache: Optional[ClassificationCache],
+    on_classified: Optional[Callable[[dict], None]],
+) -> Optional[str]:
+    """Settle ``record`` without an API call if possible; return how, or ``None``."""
+    if prefilter and not _mentions_coating_chemistry(record):
+        _apply_classification(record, None, None, include_era, on_classified)
+        return "prefilter"
+    if cache is not None:
+        cached = cache.get(_record_cache_key(record, model, batch_size))
+        if cached is not None:
+            _apply_classification(record, *cached, include_era, on_classified)
+            return "cache"
+    return None
+
+
+def _log_resolved(resolved: Counter) -> None:
+    logging.info(
+        "Resolved %s records without an LLM call (%s by prefilter, %s from cache).",
+        sum(resolved.values()),
+        resolved["prefilter"],
+        resolved["cache"],
+    )
+
+
+async def _classify_chunk(
+    client: httpx.AsyncClient,
+    chunk: Tuple[dict, ...],
+    label: str,
+    api_key: str,
+    model: str,
+    max_retries: int,
+    first_token_timeout: float,
+    semaphore: asyncio.Semaphore,
+    pacer: _RequestPacer,
+    include_era: bool,
+    batch_size: int,
+    on_classified: Optional[Callable[[dict], None]] = None,
+    cache: Optional[ClassificationCache] = None,
+) -> None:
+    logging.info(
+        "Classifying coating type (%s): %s",
+        label,
+        ", ".join(str(record.get("publication_number")) for record in chunk),
+    )
+    if len(chunk) == 1:
+        outcomes = [
+            await classify_record_async(
+                client=client,
+                record=chunk[0],
+                api_key=api_key,
+                model=model,
+                max_retries=max_retries,
+                first_token_timeout=first_token_timeout,
+                semaphore=semaphore,
+                pacer=pacer,
+            )
+        ]
+    else:
+        outcomes = await classify_batch_async(
+            client=client,
+            records_chunk=chunk,
+            api_key=api_key,
+            model=model,
+            max_retries=max_retries,
+            first_token_timeout=first_token_timeout,
+            semaphore=semaphore,
+            pacer=pacer,
+        )
+    if cache is not None:
+        entries = [
+            (_record_cache_key(record, model, batch_size), coating_type, confidence)
+            for record, (coating_type, confidence) in zip(chunk, outcomes)
+            if coating_type is not None
+        ]
+        if entries:
+            # One transaction per chunk, committed off the event loop.
+            await asyncio.to_thread(cache.set_many, entries)
+    for record, (coating_type, confidence) in zip(chunk, outcomes):
+        _apply_classification(record, coating_type, confidence, include_era, on_classified)
+
+
+async def classify_records_async(
+    records: list,
+    api_key: str,
+    model: str,
+    timeout: float,
+    max_retries: int,
+    max_concurrency: int,
+    include_era: bool,
+    delay: float = 0.0,
+    client: Optional[httpx.AsyncClient] = None,
+    batch_size: int = config.DEFAULT_BATCH_SIZE,
+    first_token_timeout: float = config.DEFAULT_OPENROUTER_FIRST_TOKEN_TIMEOUT,
+    prefilter: bool = True,
+    on_classified: Optional[Callable[[dict], None]] = None,
+    cache: Optional[ClassificationCache] = None,
+) -> None:
+    """Classify ``records`` in place with at most ``max_concurrency`` requests in flight.
+
+    Records are sent ``batch_size`` at a time. With ``prefilter`` set, records that
+    mention none of ``config.PREFILTER_TERMS`` are left unclassified without a call;
+    with a ``cache``, previously seen prompts reuse the stored result and new results
+    are stored. ``on_classified`` is called with each record as soon as its result is
+    set. Pass ``client`` to reuse a long-lived connection pool across calls; otherwise
+    one client is opened for the duration of this call and shared by every request.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be positive.")
+
+    if client is None:
+        async with build_async_client(timeout, max_concurrency) as owned_client:
+            await classify_records_async(
+                records=records,
                 api_key=api_key,
                 model=model,
-                payload=payload,
                 timeout=timeout,
+                max_retries=max_retries,
+                max_concurrency=max_concurrency,
+                include_era=include_era,
+                delay=delay,
+                client=owned_client,
+                batch_size=batch_size,
+                first_token_timeout=first_token_timeout,
+                prefilter=prefilter,
+                on_classified=on_classified,
+                cache=cache,
             )
-            choices = response.get("choices")
-            if not choices:
-                raise ValueError("No choices returned from OpenRouter response.")
-            message = choices[0].get("message", {})
-            content = (message.get("content") or "").strip()
-            if not content:
-                raise ValueError("Empty content in LLM response.")
-            try:
-                parsed = json.loads(content)
-            except json.JSONDecodeError as err:  # pragma: no cover - difficult to hit in practice
-                raise ValueError(f"Failed to parse JSON from response: {content}") from err
-            coating_type = parsed.get("coating_type")
-            confidence = parsed.get("confidence")
-            if coating_type and coating_type not in config.COATING_CHOICES:
-                logging.warning(
-                    "Received coating_type '%s' outside expected choices.",
-                    coating_type,
+        return
+
+    candidates = []
+    resolved: Counter = Counter()
+    for record in records:
+        outcome = _resolve_locally(record, model, batch_size, include_era, prefilter, cache, on_classified)
+        if outcome is None:
+            candidates.append(record)
+        else:
+            resolved[outcome] += 1
+    _log_resolved(resolved)
+
+    chunks = list(utils.chunked(candidates, size=batch_size))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pacer = _RequestPacer(delay)
+
+    await asyncio.gather(
+        *[
+            _classify_chunk(
+                client=client,
+                chunk=chunk,
+                label=f"batch {index}/{len(chunks)}",
+                api_key=api_key,
+                model=model,
+                max_retries=max_retries,
+                first_token_timeout=first_token_timeout,
+                semaphore=semaphore,
+                pacer=pacer,
+                include_era=include_era,
+                batch_size=batch_size,
+                on_classified=on_classified,
+                cache=cache,
+            )
+            for index, chunk in enumerate(chunks, start=1)
+        ]
+    )
+
+
+async def classify_queue_async(
+    queue: asyncio.Queue,
+    api_key: str,
+    model: str,
+    timeout: float,
+    max_retries: int,
+    max_concurrency: int,
+    include_era: bool,
+    delay: float = 0.0,
+    client: Optional[httpx.AsyncClient] = None,
+    batch_size: int = config.DEFAULT_BATCH_SIZE,
+    first_token_timeout: float = config.DEFAULT_OPENROUTER_FIRST_TOKEN_TIMEOUT,
+    prefilter: bool = True,
+    on_classified: Optional[Callable[[dict], None]] = None,
+    cache: Optional[ClassificationCache] = None,
+) -> None:
+    """Classify records in place as they are pulled from ``queue``.
+
+    A batch is dispatched as soon as ``batch_size`` records have arrived, so requests
+    overlap with whatever is still filling the queue. Prefiltering and caching work as
+    in ``classify_records_async``. A ``None`` item marks the end of input; any partial
+    batch is then flushed and all outstanding requests awaited.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be positive.")
+    if batch_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    if client is None:
+        async with build_async_client(timeout, max_concurrency) as owned_client:
+            await classify_queue_async(
+                queue=queue,
+                api_key=api_key,
+                model=model,
+                timeout=timeout,
+                max_retries=max_retries,
+                max_concurrency=max_concurrency,
+                include_era=include_era,
+                delay=delay,
+                client=owned_client,
+                batch_size=batch_size,
+                first_token_timeout=first_token_timeout,
+                prefilter=prefilter,
+                on_classified=on_classified,
+                cache=cache,
+            )
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pacer = _RequestPacer(delay)
+    tasks = []
+    chunk: List[dict] = []
+    resolved: Counter = Counter()
+    while True:
+        record = await queue.get()
+        if record is not None:
+            outcome = _resolve_locally(record, model, batch_size, include_era, prefilter, cache, on_classified)
+            if outcome is not None:
+                resolved[outcome] += 1
+                continue
+        if record is not None:
+            chunk.append(record)
+        if chunk and (record is None or len(chunk) >= batch_size):
+            tasks.append(
+                asyncio.create_task(
+                    _classify_chunk(
+                        client=client,
+                        chunk=tuple(chunk),
+                        label=f"batch {len(tasks) + 1}",
+                        api_key=api_key,
+                        model=model,
+                        max_retries=max_retries,
+                        first_token_timeout=first_token_timeout,
+                        semaphore=semaphore,
+                        pacer=pacer,
+                        include_era=include_era,
+                        batch_size=batch_size,
+                        on_classified=on_classified,
+                        cache=cache,
+                    )
                 )
-            return coating_type, float(confidence) if confidence is not None else None
-        except requests.HTTPError as exc:
-            logging.error("OpenRouter HTTP error (attempt %s/%s): %s", attempt, max_retries, exc)
-        except Exception as exc:  # noqa: BLE001
-            logging.error("OpenRouter error (attempt %s/%s): %s", attempt, max_retries, exc)
-        if attempt < max_retries:
-            time.sleep(2 ** attempt * 0.5)
-    return None, None
+            )
+            chunk = []
+        if record is None:
+            break
+
+    _log_resolved(resolved)
+    await asyncio.gather(*tasks)
 
 
 def classify_records(
@@ -134,25 +908,27 @@ def classify_records(
     max_retries: int,
     delay: float,
     include_era: bool,
+    max_concurrency: int = config.DEFAULT_MAX_CONCURRENCY,
+    batch_size: int = config.DEFAULT_BATCH_SIZE,
+    first_token_timeout: float = config.DEFAULT_OPENROUTER_FIRST_TOKEN_TIMEOUT,
+    prefilter: bool = True,
+    on_classified: Optional[Callable[[dict], None]] = None,
+    cache: Optional[ClassificationCache] = None,
 ) -> None:
-    total = len(records)
-    for index, record in enumerate(records, start=1):
-        logging.info(
-            "Classifying coating type (%s/%s): %s",
-            index,
-            total,
-            record.get("publication_number"),
-        )
-        coating_type, confidence = classify_record(
-            record=record,
+    asyncio.run(
+        classify_records_async(
+            records=records,
             api_key=api_key,
             model=model,
             timeout=timeout,
             max_retries=max_retries,
+            max_concurrency=max_concurrency,
+            include_era=include_era,
+            delay=delay,
+            batch_size=batch_size,
+            first_token_timeout=first_token_timeout,
+            prefilter=prefilter,
+            on_classified=on_classified,
+            cache=cache,
         )
-        record["coating_type"] = coating_type
-        record["classification_confidence"] = confidence
-        if include_era:
-            record["era"] = utils.determine_era(record.get("publication_year"), coating_type)
-        if index != total and delay > 0:
-            time.sleep(delay)
+    )
@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+from contextlib import nullcontext
 from datetime import datetime, timezone
 import logging
 import os
 import platform
 import sys
 import time
-from typing import Optional, Sequence
+from typing import Callable, Iterable, Iterator, Optional, Sequence
 
+import google.auth
 from dotenv import find_dotenv, load_dotenv
-from google.cloud import bigquery
+from google.cloud import bigquery, bigquery_storage
 from google.oauth2 import service_account
 
 from . import config, exporter, llm_classifier, query_builder, utils
+from .llm_cache import ClassificationCache
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -67,19 +71,57 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         "--openrouter-timeout",
         type=float,
         default=config.DEFAULT_OPENROUTER_TIMEOUT,
-        help="Timeout (seconds) for OpenRouter API calls.",
+        help="Overall timeout (seconds) for a streamed OpenRouter response.",
+    )
+    parser.add_argument(
+        "--openrouter-first-token-timeout",
+        type=float,
+        default=config.DEFAULT_OPENROUTER_FIRST_TOKEN_TIMEOUT,
+        help="Abort and retry an OpenRouter call if no token arrives within this many seconds.",
     )
     parser.add_argument(
         "--openrouter-delay",
         type=float,
         default=config.DEFAULT_OPENROUTER_DELAY,
-        help="Delay between successive classification calls to avoid rate limits.",
+        help=(
+            "Minimum delay between successive classification request starts to avoid rate limits "
+            "(default 0: only --max-concurrency bounds load)."
+        ),
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=config.DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of OpenRouter requests in flight at once.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=config.DEFAULT_BATCH_SIZE,
+        help="Number of patents classified per OpenRouter request.",
     )
     parser.add_argument(
         "--skip-llm",
         action="store_true",
         help="Skip OpenRouter classification stage (coating_type will be empty).",
     )
+    parser.add_argument(
+        "--no-prefilter",
+        dest="prefilter",
+        action="store_false",
+        help="Send every record to the LLM, even those mentioning no coating chemistry terms.",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=config.DEFAULT_CACHE_PATH,
+        help="SQLite file caching classification results between runs.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="Always call OpenRouter, ignoring and not updating the classification cache.",
+    )
     parser.add_argument(
         "--era-column",
         action="store_true",
@@ -95,7 +137,10 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         "--description-word-limit",
         type=int,
         default=config.DEFAULT_DESCRIPTION_WORD_LIMIT,
-        help="Maximum number of words to retain from the description excerpt.",
+        help=(
+            "Approximate number of words to retain from the description excerpt "
+            f"(applied as a cap of {config.DESCRIPTION_CHARS_PER_WORD} characters per word)."
+        ),
     )
     parser.add_argument(
         "--max-retries",
@@ -179,6 +224,86 @@ def resolve_project_id(cli_value: Optional[str]) -> tuple[Optional[str], str]:
     return None, ""
 
 
+def _collect(
+    rows: Iterable[dict],
+    sink: list,
+    forward: Optional[Callable[[Optional[dict]], None]] = None,
+) -> Iterator[dict]:
+    """Yield ``rows`` unchanged while appending each one to ``sink``.
+
+    When ``forward`` is given, each row is handed on once the consumer has taken it
+    (so the raw export never sees classification fields), followed by ``None``.
+    """
+    try:
+        for row in rows:
+            sink.append(row)
+            yield row
+            if forward is not None:
+                forward(row)
+    finally:
+        if forward is not None:
+            forward(None)
+
+
+def _in_input_order(records: list, emit: Callable[[dict], None]) -> Callable[[dict], None]:
+    """Return a callback that hands completed records to ``emit`` in ``records`` order."""
+    completed: set = set()
+    position = 0
+
+    def _on_classified(record: dict) -> None:
+        nonlocal position
+        completed.add(id(record))
+        while position < len(records) and id(records[position]) in completed:
+            completed.discard(id(records[position]))
+            emit(records[position])
+            position += 1
+
+    return _on_classified
+
+
+async def _export_and_classify(
+    rows: Iterable[dict],
+    records: list,
+    args: argparse.Namespace,
+    api_key: str,
+    classified_writer: exporter.AsyncCsvWriter,
+    cache: Optional[ClassificationCache],
+) -> None:
+    """Write the raw CSV on a worker thread while classifying rows as they stream in.
+
+    Classified rows are queued to ``classified_writer`` as soon as they and every
+    earlier row are done, so the classified export is written alongside the LLM calls.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def _forward(row: Optional[dict]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, row)
+
+    producer = asyncio.to_thread(
+        exporter.write_csv,
+        records=_collect(rows, records, _forward),
+        path=args.output_raw,
+        include_era=False,
+    )
+    consumer = llm_classifier.classify_queue_async(
+        queue=queue,
+        api_key=api_key,
+        model=args.openrouter_model,
+        timeout=args.openrouter_timeout,
+        max_retries=args.max_retries,
+        max_concurrency=args.max_concurrency,
+        include_era=args.era_column,
+        delay=args.openrouter_delay,
+        batch_size=args.batch_size,
+        first_token_timeout=args.openrouter_first_token_timeout,
+        prefilter=args.prefilter,
+        on_classified=_in_input_order(records, classified_writer.put),
+        cache=cache,
+    )
+    await asyncio.gather(producer, consumer)
+
+
 def run_pipeline(args: argparse.Namespace) -> int:
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s: %(message)s")
     start_time = time.perf_counter()
@@ -216,65 +341,70 @@ def run_pipeline(args: argparse.Namespace) -> int:
     )
     logging.debug("Target BigQuery project: %s", project_id)
 
-    try:
-        client = bigquery.Client(project=project_id)
-    except Exception as err:  # noqa: BLE001
-        logging.error("Unable to initialise BigQuery client: %s", err)
-        return 1
-
-    try:
-        records = query_builder.fetch_patent_records(
-            client=client,
-            limit=args.limit,
-            start_year=args.start_year,
-            end_year=args.end_year,
-            description_word_limit=args.description_word_limit,
-        )
-    except Exception as err:  # noqa: BLE001
-        logging.error("BigQuery execution failed: %s", err)
-        return 1
-
-    logging.info("Fetched %s candidate patents.", len(records))
-
-    # Always write the raw export after the BigQuery step.
-    try:
-        exporter.write_csv(records=records, path=args.output_raw, include_era=False)
-    except Exception as err:  # noqa: BLE001
-        logging.error("Failed to write raw CSV: %s", err)
-        return 1
-
+    api_key = None
     if not args.skip_llm:
         api_key = os.getenv(config.ENV_OPENROUTER_API_KEY)
         if not api_key:
             logging.error("%s environment variable is required for classification.", config.ENV_OPENROUTER_API_KEY)
             return 1
-        llm_classifier.classify_records(
-            records=records,
-            api_key=api_key,
-            model=args.openrouter_model,
-            timeout=args.openrouter_timeout,
-            max_retries=args.max_retries,
-            delay=args.openrouter_delay,
-            include_era=args.era_column,
-        )
-    else:
-        logging.info("Skipping LLM classification as requested.")
-        for record in records:
-            record["coating_type"] = None
-            record["classification_confidence"] = None
-            if args.era_column:
-                record["era"] = utils.determine_era(record.get("publication_year"), None)
 
     try:
-        exporter.write_csv(
-            records=records,
-            path=args.output_classified,
-            include_era=args.era_column,
-        )
+        credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+        client = bigquery.Client(project=project_id, credentials=credentials)
+        # Same credentials for Storage Read API downloads; closed once rows are consumed.
+        bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
     except Exception as err:  # noqa: BLE001
-        logging.error("Failed to write classified CSV: %s", err)
+        logging.error("Unable to initialise BigQuery client: %s", err)
         return 1
 
+    with bqstorage_client:
+        try:
+            rows = query_builder.iter_patent_records(
+                client=client,
+                limit=args.limit,
+                start_year=args.start_year,
+                end_year=args.end_year,
+                description_word_limit=args.description_word_limit,
+                bqstorage_client=bqstorage_client,
+            )
+        except Exception as err:  # noqa: BLE001
+            logging.error("BigQuery execution failed: %s", err)
+            return 1
+
+        # Always write the raw export. Rows stream straight into the CSV and, when
+        # classification is enabled, are classified while later rows are still arriving.
+        records: list = []
+        if api_key:
+            try:
+                cache_context = ClassificationCache(args.cache_path) if args.cache else nullcontext()
+                with cache_context as cache, exporter.AsyncCsvWriter(
+                    args.output_classified, include_era=args.era_column
+                ) as writer:
+                    asyncio.run(_export_and_classify(rows, records, args, api_key, writer, cache))
+            except Exception as err:  # noqa: BLE001
+                logging.error("Failed to export and classify records: %s", err)
+                return 1
+            logging.info("Fetched and classified %s candidate patents.", len(records))
+        else:
+            try:
+                exporter.write_csv(records=_collect(rows, records), path=args.output_raw, include_era=False)
+            except Exception as err:  # noqa: BLE001
+                logging.error("Failed to write raw CSV: %s", err)
+                return 1
+
+            logging.info("Fetched %s candidate patents.", len(records))
+            logging.info("Skipping LLM classification as requested.")
+
+            try:
+                exporter.write_frame_csv(
+                    records=records,
+                    path=args.output_classified,
+                    include_era=args.era_column,
+                )
+            except Exception as err:  # noqa: BLE001
+                logging.error("Failed to write classified CSV: %s", err)
+                return 1
+
     logging.info("Raw data saved to %s", args.output_raw)
     logging.info("Classified data saved to %s", args.output_classified)
     logging.info("Pipeline completed successfully in %.2f seconds.", time.perf_counter() - start_time)
@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-from google.cloud import bigquery
+import pyarrow
+from google.api_core.exceptions import Forbidden
+from google.cloud import bigquery, bigquery_storage
 from google.cloud.bigquery import QueryJobConfig, ScalarQueryParameter
 
 from . import config, utils
 
 
+# Query output columns whose record key differs from the SQL alias.
+_COLUMN_RENAMES = {"description_excerpt": "description"}
+
+
 def build_query(limit: int, description_word_limit: int) -> str:
     return f"""
 WITH base AS (
@@ -86,7 +92,13 @@ WITH base AS (
     AND EXISTS (
       SELECT 1
       FROM UNNEST(cpc) AS c
-      WHERE {utils.CPC_CONDITION}
+      WHERE {utils.cpc_condition()}
+    )
+    -- Keyword pruning happens here so the per-row subqueries above only run on matches.
+    AND (
+      EXISTS (SELECT 1 FROM UNNEST(title_localized) AS tl WHERE REGEXP_CONTAINS(tl.text, @keyword_pattern))
+      OR EXISTS (SELECT 1 FROM UNNEST(abstract_localized) AS al WHERE REGEXP_CONTAINS(al.text, @keyword_pattern))
+      OR EXISTS (SELECT 1 FROM UNNEST(description_localized) AS dl WHERE REGEXP_CONTAINS(dl.text, @keyword_pattern))
     )
 )
 SELECT
@@ -97,17 +109,9 @@ SELECT
   abstract_en AS abstract,
   assignee_orgs AS assignee,
   cpc_codes,
-  CASE
-    WHEN description_en IS NULL THEN NULL
-    ELSE ARRAY_TO_STRING(ARRAY_SLICE(SPLIT(description_en, ' '), 0, @description_word_limit), ' ')
-  END AS description_excerpt,
+  SUBSTR(description_en, 1, @description_char_limit) AS description_excerpt,
   first_claim_en AS first_claim
 FROM base
-WHERE (
-  (title_en IS NOT NULL AND REGEXP_CONTAINS(LOWER(title_en), @keyword_pattern)) OR
-  (abstract_en IS NOT NULL AND REGEXP_CONTAINS(LOWER(abstract_en), @keyword_pattern)) OR
-  (description_en IS NOT NULL AND REGEXP_CONTAINS(LOWER(description_en), @keyword_pattern))
-)
 ORDER BY publication_date DESC
 LIMIT {limit}
 """
@@ -124,20 +128,33 @@ def assemble_query_config(
     parameters = [
         ScalarQueryParameter("start_date", "INT64", start_date),
         ScalarQueryParameter("end_date", "INT64", end_date),
-        ScalarQueryParameter("keyword_pattern", "STRING", utils.KEYWORD_PATTERN),
-        ScalarQueryParameter("description_word_limit", "INT64", description_word_limit),
+        ScalarQueryParameter("keyword_pattern", "STRING", utils.keyword_pattern()),
+        # A character slice is far cheaper in BigQuery than splitting the description into words.
+        ScalarQueryParameter(
+            "description_char_limit",
+            "INT64",
+            description_word_limit * config.DESCRIPTION_CHARS_PER_WORD,
+        ),
     ]
 
     return QueryJobConfig(query_parameters=parameters)
 
 
-def fetch_patent_records(
+def iter_patent_records(
     client: bigquery.Client,
     limit: int,
     start_year: int,
     end_year: int,
     description_word_limit: int,
-) -> List[Dict[str, Optional[str]]]:
+    bqstorage_client: Optional[bigquery_storage.BigQueryReadClient] = None,
+) -> Iterator[Dict[str, Optional[str]]]:
+    """Run the query and return an iterator that yields records as batches arrive.
+
+    The job is submitted and awaited eagerly so query errors surface here; rows are
+    only pulled from BigQuery as the returned iterator is consumed. With a
+    ``bqstorage_client`` (owned and closed by the caller) rows are downloaded over the
+    Storage Read API, falling back to the REST API if a read session is not permitted.
+    """
     sql = build_query(limit=limit, description_word_limit=description_word_limit)
     job_config = assemble_query_config(
         start_year=start_year,
@@ -149,19 +166,58 @@ def fetch_patent_records(
     results = query_job.result()
     logging.info("Retrieved %s rows from BigQuery.", results.total_rows)
 
-    extracted = []
-    for row in results:
-        extracted.append(
-            {
-                "publication_number": row.get("publication_number"),
-                "publication_date": row.get("publication_date"),
-                "publication_year": row.get("publication_year"),
-                "title": row.get("title"),
-                "abstract": row.get("abstract"),
-                "assignee": row.get("assignee"),
-                "cpc_codes": list(row.get("cpc_codes") or []),
-                "description": row.get("description_excerpt"),
-                "first_claim": row.get("first_claim"),
-            }
+    batches = _arrow_batches(query_job, results, bqstorage_client)
+    return (record for batch in batches for record in _records_from_batch(batch))
+
+
+def _arrow_batches(
+    query_job: bigquery.QueryJob,
+    results: bigquery.table.RowIterator,
+    bqstorage_client: Optional[bigquery_storage.BigQueryReadClient],
+) -> Iterator[pyarrow.RecordBatch]:
+    # Pull rows as Arrow record batches over the Storage Read API instead of the
+    # JSON tabledata.list pages; small results may still fall back to REST.
+    if bqstorage_client is not None:
+        started = False
+        try:
+            for batch in results.to_arrow_iterable(bqstorage_client=bqstorage_client):
+                started = True
+                yield batch
+            return
+        except Forbidden as err:
+            # Missing bigquery.readsessions.create; nothing has been yielded yet, so
+            # the rows can still be read over REST as before the Storage API was used.
+            if started:
+                raise
+            logging.warning("BigQuery Storage read session denied (%s); using the REST API instead.", err)
+        # A row iterator can only be consumed once, so fetch a fresh one for the job.
+        results = query_job.result()
+    yield from results.to_arrow_iterable()
+
+
+def _records_from_batch(batch: pyarrow.RecordBatch) -> List[Dict[str, Optional[str]]]:
+    # Rename once per batch and let Arrow build the dicts in C instead of per-row lookups.
+    names = [_COLUMN_RENAMES.get(name, name) for name in batch.schema.names]
+    records = pyarrow.RecordBatch.from_arrays(batch.columns, names=names).to_pylist()
+    for record in records:
+        if record["cpc_codes"] is None:
+            record["cpc_codes"] = []
+    return records
+
+
+def fetch_patent_records(
+    client: bigquery.Client,
+    limit: int,
+    start_year: int,
+    end_year: int,
+    description_word_limit: int,
+) -> List[Dict[str, Optional[str]]]:
+    return list(
+        iter_patent_records(
+            client=client,
+            limit=limit,
+            start_year=start_year,
+            end_year=end_year,
+            description_word_limit=description_word_limit,
         )
-    return extracted
+    )
@@ -3,40 +3,92 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Iterable, Iterator, Optional, Sequence, Tuple, TypeVar
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
 
 from . import config
 
 T = TypeVar("T")
 
+# Era rule shared by determine_era and determine_era_series.
+PRE_BPA_BEFORE_YEAR = 1991
+BPA_ERA_LAST_YEAR = 2015
+BPA_COATING_TYPES = ("Epoxy (BPA)", "Epoxy (BPF)")
+
+
+def _escape_term(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("/", "\\/")
+
+
+def _alternation(terms: Sequence[str]) -> str:
+    escaped_terms = [_escape_term(term) for term in terms]
+    if len(escaped_terms) == 1:
+        return escaped_terms[0]
+    return "(?:" + "|".join(escaped_terms) + ")"
+
 
 def build_keyword_pattern(keywords: Iterable[str]) -> str:
-    escaped_terms = [term.replace("\\", "\\\\").replace("/", "\\/") for term in keywords]
-    return "(" + "|".join(escaped_terms) + ")"
+    """Build a factored alternation such as ``(?:food|metal) (?:can|container)|can liner``.
+
+    Phrases are split into leading words and final word; leading words that share the
+    same set of final words are merged so each prefix is only tested once per position.
+    """
+    tails_by_head: Dict[str, List[str]] = {}
+    for term in keywords:
+        head, _, tail = term.rpartition(" ")
+        tails = tails_by_head.setdefault(head, [])
+        if tail not in tails:
+            tails.append(tail)
+
+    heads_by_tails: Dict[Tuple[str, ...], List[str]] = {}
+    for head, tails in tails_by_head.items():
+        heads_by_tails.setdefault(tuple(tails), []).append(head)
+
+    alternatives = []
+    for tails, heads in heads_by_tails.items():
+        words = [head for head in heads if head]
+        if words:
+            alternatives.append(f"{_alternation(words)} {_alternation(tails)}")
+        if len(words) != len(heads):
+            alternatives.append(_alternation(tails))
+    return "|".join(alternatives)
 
 
 def build_cpc_condition(prefixes: Iterable[str]) -> str:
-    normalized = [prefix.lower() for prefix in prefixes]
-    clauses = [
-        f"LOWER(REPLACE(c.code, ' ', '')) LIKE '{prefix}%'"
-        for prefix in normalized
-    ]
-    return " OR ".join(clauses)
+    # One anchored alternation normalises each code once instead of once per prefix.
+    normalized = [re.escape(prefix.lower()) for prefix in prefixes]
+    return "REGEXP_CONTAINS(LOWER(REPLACE(c.code, ' ', '')), r'^(?:" + "|".join(normalized) + ")')"
 
 
+@lru_cache(maxsize=4096)
 def determine_era(publication_year: Optional[int], coating_type: Optional[str]) -> Optional[str]:
     if not publication_year:
         return None
 
-    if publication_year < 1991:
+    if publication_year < PRE_BPA_BEFORE_YEAR:
         return "pre-BPA"
 
-    if coating_type in ("Epoxy (BPA)", "Epoxy (BPF)") and publication_year <= 2015:
+    if coating_type in BPA_COATING_TYPES and publication_year <= BPA_ERA_LAST_YEAR:
         return "BPA-era"
 
     return "modern"
 
 
+def determine_era_series(publication_years: pd.Series, coating_types: pd.Series) -> np.ndarray:
+    """Vectorised ``determine_era`` over aligned year and coating-type columns."""
+    years = pd.to_numeric(publication_years, errors="coerce")
+    conditions = [
+        years.isna() | years.eq(0),
+        years.lt(PRE_BPA_BEFORE_YEAR),
+        years.le(BPA_ERA_LAST_YEAR) & coating_types.isin(BPA_COATING_TYPES),
+    ]
+    return np.select(conditions, [None, "pre-BPA", "BPA-era"], default="modern")
+
+
 def chunked(sequence: Sequence[T], size: int) -> Iterator[Tuple[T, ...]]:
     if size <= 0:
         raise ValueError("Chunk size must be positive.")
@@ -52,5 +104,13 @@ def validate_years(start_year: int, end_year: int) -> None:
         raise ValueError("start_year must not exceed end_year.")
 
 
-KEYWORD_PATTERN = build_keyword_pattern([term.lower() for term in config.KEYWORD_PHRASES])
-CPC_CONDITION = build_cpc_condition(config.CPC_PREFIXES)
+@lru_cache(maxsize=None)
+def keyword_pattern(phrases: Tuple[str, ...] = tuple(config.KEYWORD_PHRASES)) -> str:
+    # ``(?i)`` lets RE2 fold case while matching instead of BigQuery materialising a
+    # LOWER() copy of every multi-megabyte description.
+    return "(?i)" + build_keyword_pattern([term.lower() for term in phrases])
+
+
+@lru_cache(maxsize=None)
+def cpc_condition(prefixes: Tuple[str, ...] = tuple(config.CPC_PREFIXES)) -> str:
+    return build_cpc_condition(prefixes)